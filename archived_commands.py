@@ -1,8 +1,9 @@
 # archived_commands.py
 
+import traceback
 import discord
 from discord.ext import commands
-from config.constants import CHANNELS, GENDER_ROLE_EMOJIS, PLATFORM_ROLE_EMOJIS, SERVER_ROLE_EMOJIS, GENERAL_COMMANDS
+from config.constants import CHANNELS, GENDER_ROLE_EMOJIS, PLATFORM_ROLE_EMOJIS, SERVER_ROLE_EMOJIS, GENERAL_COMMANDS, REQUIRED_ROLES
 import sqlite3
 from config.constants import DATABASE_PATH
 
@@ -10,6 +11,10 @@ from config.constants import DATABASE_PATH
 # Initialize bot (Only for commands referencing the bot instance)
 bot = commands.Bot(command_prefix="/")
 
+# Fixed replies shared by several commands
+NO_PERMISSION_MSG = "You don't have permission to use this command."
+INVALID_CHANNEL_MSG = "Invalid channel name!"
+
 
 # Test command
 @bot.tree.command(name="hello")
@@ -21,7 +26,7 @@ async def hello(interaction: discord.Interaction):
 async def post_roles_template(interaction, role_emojis, title_header):
     embed = discord.Embed(
         title=f"**{title_header}**",
-        description="\n".join([f"{emoji} - {role}" for emoji, role in role_emojis.items()]),
+        description="\n".join(f"{emoji} - {role}" for emoji, role in role_emojis.items()),
         color=discord.Color.blue()
     )
     embed.set_footer(text="React with the appropriate emoji to get your role.")
@@ -52,35 +57,40 @@ ALL_ROLE_EMOJIS = {**GENDER_ROLE_EMOJIS, **PLATFORM_ROLE_EMOJIS, **SERVER_ROLE_E
 
 @bot.event
 async def on_raw_reaction_add(payload):
-    guild = await bot.fetch_guild(payload.guild_id)
-    member = await guild.fetch_member(payload.user_id)
+    # Ignore reactions that don't map to a role before looking anything up
+    emoji_name = str(payload.emoji)
+    if emoji_name not in ALL_ROLE_EMOJIS:
+        return
+
+    # Prefer the gateway cache and only fall back to the REST API on a miss
+    guild = bot.get_guild(payload.guild_id) or await bot.fetch_guild(payload.guild_id)
+    member = payload.member or await guild.fetch_member(payload.user_id)
 
     if member.bot:
         return
 
-    emoji_name = str(payload.emoji)
-
-    if emoji_name in ALL_ROLE_EMOJIS:
-        role_name = ALL_ROLE_EMOJIS[emoji_name]
-        role = discord.utils.get(guild.roles, name=role_name)
-        if role:
-            await member.add_roles(role)
+    role_name = ALL_ROLE_EMOJIS[emoji_name]
+    role = discord.utils.get(guild.roles, name=role_name)
+    if role:
+        await member.add_roles(role)
 
 @bot.event
 async def on_raw_reaction_remove(payload):
-    guild = await bot.fetch_guild(payload.guild_id)
-    member = await guild.fetch_member(payload.user_id)
+    emoji_name = str(payload.emoji)
+    if emoji_name not in ALL_ROLE_EMOJIS:
+        return
+
+    guild = bot.get_guild(payload.guild_id) or await bot.fetch_guild(payload.guild_id)
+    member = guild.get_member(payload.user_id) or await guild.fetch_member(payload.user_id)
 
     if member.bot:
         return
 
-    emoji_name = str(payload.emoji)
-    if emoji_name in ALL_ROLE_EMOJIS:
-        role_name = ALL_ROLE_EMOJIS[emoji_name]
-        role = discord.utils.get(guild.roles, name=role_name)
-        
-        if role and role in member.roles:
-            await member.remove_roles(role)
+    role_name = ALL_ROLE_EMOJIS[emoji_name]
+    role = discord.utils.get(guild.roles, name=role_name)
+    
+    if role and role in member.roles:
+        await member.remove_roles(role)
 
 
 # Announcement commands
@@ -89,8 +99,8 @@ async def announce(interaction: discord.Interaction, *, args: str = None):
     if interaction.user.bot:
         return
 
-    if not any(role.name in ["Owner", "Headadmin"] for role in interaction.user.roles):
-        await interaction.response.send_message("You don't have permission to use this command.", ephemeral=True)
+    if not any(role.name in REQUIRED_ROLES for role in interaction.user.roles):
+        await interaction.response.send_message(NO_PERMISSION_MSG, ephemeral=True)
         return
 
     args = args.replace("|", "\n") if args else None
@@ -109,7 +119,7 @@ async def announce(interaction: discord.Interaction, *, args: str = None):
         channel_name = response.content.strip().lower()
 
         if channel_name not in CHANNELS:
-            await interaction.response.send_message("Invalid channel name!", ephemeral=True)
+            await interaction.response.send_message(INVALID_CHANNEL_MSG, ephemeral=True)
             return
 
     target_channel = bot.get_channel(CHANNELS[channel_name])
@@ -124,8 +134,8 @@ async def post(interaction: discord.Interaction, *, args: str = None):
     if interaction.user.bot:
         return
 
-    if not any(role.name in ["Owner", "Headadmin"] for role in interaction.user.roles):
-        await interaction.response.send_message("You don't have permission to use this command.", ephemeral=True)
+    if not any(role.name in REQUIRED_ROLES for role in interaction.user.roles):
+        await interaction.response.send_message(NO_PERMISSION_MSG, ephemeral=True)
         return
 
     args = args.replace("|", "\n")
@@ -144,7 +154,7 @@ async def post(interaction: discord.Interaction, *, args: str = None):
         channel_name = response.content.strip().lower()
 
         if channel_name not in CHANNELS:
-            await interaction.response.send_message("Invalid channel name!", ephemeral=True)
+            await interaction.response.send_message(INVALID_CHANNEL_MSG, ephemeral=True)
             return
 
     target_channel = bot.get_channel(CHANNELS[channel_name])
@@ -211,8 +221,8 @@ async def clear(interaction: discord.Interaction):
     if interaction.user.bot:
         return
 
-    if not any(role.name in ["Owner", "Headadmin"] for role in interaction.user.roles):
-        await interaction.response.send_message("You don't have permission to use this command.")
+    if not any(role.name in REQUIRED_ROLES for role in interaction.user.roles):
+        await interaction.response.send_message(NO_PERMISSION_MSG)
         return
 
     await interaction.response.defer()
@@ -228,13 +238,15 @@ async def clear(interaction: discord.Interaction):
 
 
 # Help Command
+GENERAL_COMMANDS_TEXT = "\n".join(GENERAL_COMMANDS)  # Static, so join it once at import
+
 @bot.tree.command(name="commands")
 async def _commands(interaction: discord.Interaction):
     if interaction.user.bot:
         return
 
     embed = discord.Embed(title="Help", description="Here's a list of my commands:", color=0x00ff00)
-    embed.add_field(name="ℹ️ General", value="\n".join(GENERAL_COMMANDS), inline=False)
+    embed.add_field(name="ℹ️ General", value=GENERAL_COMMANDS_TEXT, inline=False)
     await interaction.response.send_message(embed=embed, ephemeral=True)
 
 
@@ -248,7 +260,6 @@ async def on_command_error(ctx, error):
 
 @bot.event
 async def on_error(event, *args, **kwargs):
-    import traceback
     traceback.print_exc()
 
 
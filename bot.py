@@ -1,5 +1,6 @@
 import os
 import json
+import traceback
 import discord
 import sqlite3
 from decouple import config
@@ -58,7 +59,6 @@ async def on_command_error(ctx, error):
 
 @bot.event
 async def on_error(event, *args, **kwargs):
-    import traceback
     traceback.print_exc()
 
 @bot.event
@@ -2,25 +2,28 @@ import asyncio
 import discord
 from discord.ext import commands
 from integrations.trello import add_strike_to_trello, move_card_to_list, update_card_description, search_for_card
-from config.constants import DATABASE_PATH, TRELLO_LIST_ID, BANNED_LIST_ID, STRIKE_LIST_MAPPING, STRIKE_STAGE
+from config.constants import TRELLO_LIST_ID, BANNED_LIST_ID, STRIKE_LIST_MAPPING, STRIKE_STAGE
 from helpers.utils import prompt_for_ban_confirmation
+from database.players import fetch_player_by_id
 from discord.utils import find
-import sqlite3
 
 # Initialize bot
 bot = commands.Bot(command_prefix="/")
 
+# Strike stage names mapped back to their list IDs, built once instead of scanned per strike
+STRIKE_STAGE_LISTS = {stage: list_id for list_id, stage in STRIKE_STAGE.items()}
+
 
 @bot.tree.command(name="addstrike")
 async def addstrike_cmd(interaction: discord.Interaction, player_name: str, in_game_id: str, *, reason: str):
+    if interaction.user.bot:
+        return
+
     try:
         await interaction.response.send_message("Processing the strike...")  # Immediate acknowledgment
 
-        if interaction.user.bot:
-            return
-
         admin_name = str(interaction.user)
-        existing_card = search_for_card(in_game_id)
+        existing_card = await asyncio.to_thread(search_for_card, in_game_id)
         messages_to_send = []
 
         if existing_card:
@@ -33,9 +36,6 @@ async def addstrike_cmd(interaction: discord.Interaction, player_name: str, in_g
                 new_list_id = STRIKE_LIST_MAPPING.get(current_list_id, None)
 
                 if new_list_id:
-                    # Move the card to the new list
-                    move_success = move_card_to_list(existing_card["id"], new_list_id)
-
                     # Announce the strike stage
                     message = STRIKE_STAGE[new_list_id]
                     formatted_message = f"<@{interaction.user.id}> - Issued a {message} for {player_name} | {in_game_id}"
@@ -43,16 +43,19 @@ async def addstrike_cmd(interaction: discord.Interaction, player_name: str, in_g
 
                     # Prepare only the new information to add to the description
                     added_description = f"Admin: {admin_name}\nRule break - {reason}"
-                    update_success = update_card_description(existing_card["id"], added_description)
+
+                    # Moving the card and updating its description are independent Trello calls, so run them together
+                    move_success, update_success = await asyncio.gather(
+                        asyncio.to_thread(move_card_to_list, existing_card["id"], new_list_id),
+                        asyncio.to_thread(update_card_description, existing_card["id"], added_description)
+                    )
                     success = move_success and update_success
 
                     if not success:
                         messages_to_send.append("Failed to move or update card.")
 
                     # Check if the player needs to be banned after three strikes
-                    third_strike_id = next(key for key, value in STRIKE_STAGE.items() if value == "**3rd Strike**")
-
-                    if new_list_id == third_strike_id:
+                    if new_list_id == STRIKE_STAGE_LISTS["**3rd Strike**"]:
                         messages_to_send.append(f"⚠️ {player_name} | {in_game_id} needs to be banned! ⚠️")
 
                         # Send messages so far
@@ -62,7 +65,7 @@ async def addstrike_cmd(interaction: discord.Interaction, player_name: str, in_g
                         banned_in_game = await prompt_for_ban_confirmation(bot, interaction, player_name, in_game_id)
 
                         if banned_in_game:
-                            move_success = move_card_to_list(existing_card["id"], BANNED_LIST_ID)
+                            move_success = await asyncio.to_thread(move_card_to_list, existing_card["id"], BANNED_LIST_ID)
                             if move_success:
                                 await interaction.followup.send(f"{player_name} | {in_game_id} has been moved to banned list after in-game ban confirmation.")
                             else:
@@ -75,7 +78,7 @@ async def addstrike_cmd(interaction: discord.Interaction, player_name: str, in_g
 
         else:
             # No existing card, so create a new one
-            success = add_strike_to_trello(player_name, in_game_id, admin_name, reason)
+            success = await asyncio.to_thread(add_strike_to_trello, player_name, in_game_id, admin_name, reason)
             if success:
                 new_list_id = TRELLO_LIST_ID  # Use the list ID for the first strike
                 message = STRIKE_STAGE[new_list_id]
@@ -84,25 +87,22 @@ async def addstrike_cmd(interaction: discord.Interaction, player_name: str, in_g
             else:
                 messages_to_send.append("Failed to add strike to Trello.")
 
-        # Send any remaining messages to the admin
-        for msg in messages_to_send:
-            await interaction.followup.send(msg)
+        # Send any remaining messages to the admin in a single followup
+        if messages_to_send:
+            await interaction.followup.send('\n'.join(messages_to_send))
 
         # Notify the player if they have linked their account
         try:
-            with sqlite3.connect(DATABASE_PATH) as conn:
-                c = conn.cursor()
-                c.execute("SELECT username FROM players WHERE playerid=?", (in_game_id,))
-                result = c.fetchone()
-                if result:
-                    discord_username = result[0]
-                    guild = interaction.guild
-                    user = find(lambda m: str(m) == discord_username, guild.members)
-                    if user:
-                        try:
-                            await user.send(f"You have received a strike for the following reason:\n{reason}")
-                        except discord.Forbidden:
-                            print(f"Could not send DM to user {user.name}.")
+            result = await asyncio.to_thread(fetch_player_by_id, in_game_id)
+            if result:
+                discord_username = result[0]
+                guild = interaction.guild
+                user = find(lambda m: str(m) == discord_username, guild.members)
+                if user:
+                    try:
+                        await user.send(f"You have received a strike for the following reason:\n{reason}")
+                    except discord.Forbidden:
+                        print(f"Could not send DM to user {user.name}.")
         except Exception as e:
             print(f"Error in notifying user about strike: {e}")
 
@@ -1,7 +1,17 @@
+import asyncio
 import re
-import sqlite3
 from discord.ext import commands
-from config.constants import DATABASE_PATH
+from database.players import save_player, fetch_player_by_id, fetch_player_by_username
+
+# AlderonID player IDs look like XXX-XXX-XXX
+PLAYER_ID_PATTERN = re.compile(r"^\d{3}-\d{3}-\d{3}$")
+
+# Fixed replies shared by the player commands
+INVALID_ID_MSG = "Invalid ID format. Please use the format XXX-XXX-XXX."
+SETID_ERROR_MSG = "An error occurred while setting your player ID and name."
+PLAYER_ID_NOT_FOUND_MSG = "No Discord user found for that player ID."
+USERNAME_NOT_FOUND_MSG = "No player ID found for that Discord user."
+PLAYERID_ERROR_MSG = "An error occurred while retrieving the player ID."
 
 # Command to set a player's ID and name
 @commands.command(name="alderonid")
@@ -17,24 +27,21 @@ async def setid(interaction, playerid: str, playername: str):
     if interaction.user.bot:
         return
 
-    if not re.match(r"^\d{3}-\d{3}-\d{3}$", playerid):
-        await interaction.response.send_message(
-            "Invalid ID format. Please use the format XXX-XXX-XXX.", ephemeral=True)
+    if not PLAYER_ID_PATTERN.match(playerid):
+        await interaction.response.send_message(INVALID_ID_MSG, ephemeral=True)
         return
 
-    # Connect to the database and insert/update player data
+    # Acknowledge before touching the database so slow writes can't expire the interaction
+    await interaction.response.defer(ephemeral=True)
+
+    # Insert/update player data
     try:
-        with sqlite3.connect(DATABASE_PATH) as conn:
-            c = conn.cursor()
-            c.execute("INSERT OR REPLACE INTO players (username, playerid, playername) VALUES (?, ?, ?)",
-                      (str(interaction.user), playerid, playername))
-            conn.commit()
-            await interaction.response.send_message(
-                f"Player ID and name for {interaction.user.mention} set to {playerid}, {playername}", ephemeral=True)
+        await asyncio.to_thread(save_player, str(interaction.user), playerid, playername)
+        await interaction.followup.send(
+            f"Player ID and name for {interaction.user.mention} set to {playerid}, {playername}", ephemeral=True)
     except Exception as e:
         print(f"Error in /alderonid command: {e}")
-        await interaction.response.send_message(
-            "An error occurred while setting your player ID and name.", ephemeral=True)
+        await interaction.followup.send(SETID_ERROR_MSG, ephemeral=True)
 
 # Command to retrieve a player's ID or username based on input
 @commands.command(name="playerid")
@@ -49,34 +56,30 @@ async def playerid(interaction, query: str):
     if interaction.user.bot:
         return
 
-    # Connect to the database and fetch player data
+    # Acknowledge before touching the database so slow reads can't expire the interaction
+    await interaction.response.defer(ephemeral=True)
+
+    # Fetch player data
     try:
-        with sqlite3.connect(DATABASE_PATH) as conn:
-            c = conn.cursor()
-            if re.match(r"^\d{3}-\d{3}-\d{3}$", query):  # Query is a player ID
-                c.execute("SELECT username, playername FROM players WHERE playerid=?", (query,))
-                result = c.fetchone()
+        if PLAYER_ID_PATTERN.match(query):  # Query is a player ID
+            result = await asyncio.to_thread(fetch_player_by_id, query)
 
-                if result:
-                    username, playername = result
-                    await interaction.response.send_message(
-                        f"The Discord user associated with player ID {query} is {username} (Player Name: {playername})",
-                        ephemeral=True)
-                else:
-                    await interaction.response.send_message(
-                        "No Discord user found for that player ID.", ephemeral=True)
-            else:  # Query is a Discord username
-                c.execute("SELECT playerid, playername FROM players WHERE username=?", (query,))
-                result = c.fetchone()
+            if result:
+                username, playername = result
+                await interaction.followup.send(
+                    f"The Discord user associated with player ID {query} is {username} (Player Name: {playername})",
+                    ephemeral=True)
+            else:
+                await interaction.followup.send(PLAYER_ID_NOT_FOUND_MSG, ephemeral=True)
+        else:  # Query is a Discord username
+            result = await asyncio.to_thread(fetch_player_by_username, query)
 
-                if result:
-                    playerid, playername = result
-                    await interaction.response.send_message(
-                        f"The player ID for {query} is {playerid} (Player Name: {playername})", ephemeral=True)
-                else:
-                    await interaction.response.send_message(
-                        "No player ID found for that Discord user.", ephemeral=True)
+            if result:
+                playerid, playername = result
+                await interaction.followup.send(
+                    f"The player ID for {query} is {playerid} (Player Name: {playername})", ephemeral=True)
+            else:
+                await interaction.followup.send(USERNAME_NOT_FOUND_MSG, ephemeral=True)
     except Exception as e:
         print(f"Error in /playerid command: {e}")
-        await interaction.response.send_message(
-            "An error occurred while retrieving the player ID.", ephemeral=True)
+        await interaction.followup.send(PLAYERID_ERROR_MSG, ephemeral=True)
@@ -1,4 +1,5 @@
-REQUIRED_ROLES = ['Owner', 'Headadmin']
+# Role names allowed to run staff commands; a frozenset so role checks are hash lookups
+REQUIRED_ROLES = frozenset({'Owner', 'Headadmin'})
 
 CHANNELS = {
     "rules": 1144340352224985189,          # channel ID for "rules"
@@ -33,7 +34,7 @@ SERVER_ROLE_EMOJIS = {
     
 }
 
-GENERAL_COMMANDS = [
+GENERAL_COMMANDS = (
         "/announce: Send an announcement to a specific channel",
         "/post: Post content to a specific channel",
         "/chooseyourgender: Display a message for users to select their roles using reactions",
@@ -42,6 +43,6 @@ GENERAL_COMMANDS = [
         "/playerid: Query the Discord user associated with a player ID or vice versa",
         "/alderonid: Link your Discord Account to your AlderonID ",
         "/clear: Clear a specified number of messages from a channel"
-    ]
+    )
 
 DATABASE_PATH = 'players.db'
\ No newline at end of file
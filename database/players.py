@@ -0,0 +1,23 @@
+# database/players.py
+import sqlite3
+from config.constants import DATABASE_PATH
+
+# Blocking sqlite helpers for the players table; call them through asyncio.to_thread from async code
+def save_player(username: str, playerid: str, playername: str) -> None:
+    with sqlite3.connect(DATABASE_PATH) as conn:
+        c = conn.cursor()
+        c.execute("INSERT OR REPLACE INTO players (username, playerid, playername) VALUES (?, ?, ?)",
+                  (username, playerid, playername))
+        conn.commit()
+
+def fetch_player_by_id(playerid: str):
+    with sqlite3.connect(DATABASE_PATH) as conn:
+        c = conn.cursor()
+        c.execute("SELECT username, playername FROM players WHERE playerid=?", (playerid,))
+        return c.fetchone()
+
+def fetch_player_by_username(username: str):
+    with sqlite3.connect(DATABASE_PATH) as conn:
+        c = conn.cursor()
+        c.execute("SELECT playerid, playername FROM players WHERE username=?", (username,))
+        return c.fetchone()
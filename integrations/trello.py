@@ -1,5 +1,6 @@
 import logging
 import os
+import threading
 import requests
 from dotenv import load_dotenv
 from typing import Optional
@@ -11,21 +12,35 @@ TRELLO_TOKEN = os.getenv('TRELLO_TOKEN')
 TRELLO_LIST_ID = os.getenv('TRELLO_LIST_ID')
 TRELLO_BOARD_ID = os.getenv("TRELLO_BOARD_ID")
 
+# Credentials sent with every Trello request
+AUTH_PARAMS = {
+    'key': TRELLO_API_KEY,
+    'token': TRELLO_TOKEN
+}
+
+# One session per thread so consecutive Trello calls reuse a keep-alive connection. The helpers run in
+# asyncio.to_thread workers, sometimes several at once, and requests.Session isn't documented as thread-safe
+_thread_local = threading.local()
+
+def get_session() -> requests.Session:
+    session = getattr(_thread_local, 'session', None)
+    if session is None:
+        session = _thread_local.session = requests.Session()
+    return session
+
+# Seconds to wait on Trello before giving up, so a hung request can't stall a strike indefinitely
+REQUEST_TIMEOUT = 10
+
 def get_label_id_by_color(board_id: str, color: str) -> Optional[str]:
     url = f"https://api.trello.com/1/boards/{board_id}/labels"
     
-    query = {
-        'key': TRELLO_API_KEY,
-        'token': TRELLO_TOKEN
-    }
-
-    response = requests.get(url, params=query)
+    response = get_session().get(url, params=AUTH_PARAMS, timeout=REQUEST_TIMEOUT)
     response.raise_for_status()
 
     labels = response.json()
     for label in labels:
-        if label.get('color') == color:
-            return label.get('id')
+        if label['color'] == color:
+            return label['id']
 
     return None
 
@@ -38,21 +53,21 @@ def add_strike_to_trello(player_name: str, in_game_id: str, admin_name: str, rul
         "name": card_name,
         "desc": card_desc,
         "idList": TRELLO_LIST_ID,
-        'key': TRELLO_API_KEY,
-        'token': TRELLO_TOKEN
+        **AUTH_PARAMS
     }
 
-    if color_label:
-        label_id = get_label_id_by_color(TRELLO_BOARD_ID, color_label)
-        if label_id:
-            data['idLabels'] = [label_id]
-
     try:
-        response = requests.post(url, json=data)
+        if color_label:
+            label_id = get_label_id_by_color(TRELLO_BOARD_ID, color_label)
+            if label_id:
+                data['idLabels'] = [label_id]
+
+        response = get_session().post(url, json=data, timeout=REQUEST_TIMEOUT)
         response.raise_for_status()
         return True
-    except requests.HTTPError:
-        print(f"Failed to add card for {card_name}. HTTP Error: {response.text}")
+    except requests.exceptions.RequestException as e:
+        # Log the error type only, the message can echo a request URL carrying the key and token
+        logging.error(f"Failed to add card for {card_name}. Error: {type(e).__name__}")
         return False
 
 
@@ -60,29 +75,19 @@ def search_for_card(in_game_id: str) -> Optional[dict]:
     url = f"https://api.trello.com/1/boards/{TRELLO_BOARD_ID}/cards"
     
     query = {
-        'key': TRELLO_API_KEY,
-        'token': TRELLO_TOKEN
+        **AUTH_PARAMS,
+        'fields': 'name,idList'  # Card lookups only need the name and current list
     }
 
-    response = requests.get(url, params=query)
+    response = get_session().get(url, params=query, timeout=REQUEST_TIMEOUT)
     
-    # Handling potential HTTP errors first
-    try:
-        response.raise_for_status()
-    except requests.exceptions.HTTPError as err:
-        print(f"HTTP error occurred: {err}")
-        # Handle the exception or exit the script
-        exit()
+    # Let HTTP errors propagate so the calling command can report them instead of stopping the bot
+    response.raise_for_status()
 
-    
     cards = response.json()
 
-    # Print each card's name
-    for card in cards:
-        print(card.get('name'))
-
     # Return the card that matches the in_game_id
-    return next((card for card in cards if in_game_id in card.get('name')), None)
+    return next((card for card in cards if in_game_id in card['name']), None)
 
 
 
@@ -91,35 +96,39 @@ def update_card_description(card_id: str, added_description: str) -> bool:
     
     # Fetch the current description first
     get_data = {
-        'key': TRELLO_API_KEY,
-        'token': TRELLO_TOKEN,
+        **AUTH_PARAMS,
         'fields': 'desc'  # We only want the description
     }
-    response_get = requests.get(url_get, params=get_data)
-    
-    # Check if request was successful
-    if response_get.status_code != 200:
-        print(f"Failed to get current description for card {card_id}. HTTP Error: {response_get.text}")
-        return False
 
-    # Append the new data to the existing description
-    current_description = response_get.json().get('desc', '')
-    new_description = current_description + "\n" + added_description
-    
-    # Now, update the card with the new description
-    url_update = f"https://api.trello.com/1/cards/{card_id}"
-    update_data = {
-        'key': TRELLO_API_KEY,
-        'token': TRELLO_TOKEN,
-        'desc': new_description
-    }
-    response_update = requests.put(url_update, json=update_data)
-    
-    if response_update.status_code != 200:
-        print(f"Failed to update card {card_id}. HTTP Error: {response_update.text}")
-        return False
+    try:
+        response_get = get_session().get(url_get, params=get_data, timeout=REQUEST_TIMEOUT)
+        
+        # Check if request was successful
+        if response_get.status_code != 200:
+            print(f"Failed to get current description for card {card_id}. HTTP Error: {response_get.text}")
+            return False
+
+        # Append the new data to the existing description
+        current_description = response_get.json().get('desc', '')
+        new_description = current_description + "\n" + added_description
+        
+        # Now, update the card with the new description
+        url_update = f"https://api.trello.com/1/cards/{card_id}"
+        update_data = {
+            **AUTH_PARAMS,
+            'desc': new_description
+        }
+        response_update = get_session().put(url_update, json=update_data, timeout=REQUEST_TIMEOUT)
+        
+        if response_update.status_code != 200:
+            print(f"Failed to update card {card_id}. HTTP Error: {response_update.text}")
+            return False
 
-    return True
+        return True
+    except requests.exceptions.RequestException as e:
+        # Log the error type only, the message can echo a request URL carrying the key and token
+        logging.error(f"Failed to update description for card {card_id}. Error: {type(e).__name__}")
+        return False
 
 
 def move_card_to_list(card_id: str, new_list_id: str) -> bool:
@@ -143,13 +152,12 @@ def move_card_to_list(card_id: str, new_list_id: str) -> bool:
     url = f"https://api.trello.com/1/cards/{card_id}"
     
     data = {
-        'key': TRELLO_API_KEY,
-        'token': TRELLO_TOKEN,
+        **AUTH_PARAMS,
         'idList': new_list_id
     }
     
     try:
-        response = requests.put(url, json=data)
+        response = get_session().put(url, json=data, timeout=REQUEST_TIMEOUT)
         if response.status_code != 200:
             return False
         if response.json().get('idList') != new_list_id: